@@ -1,767 +1,1469 @@
-"""
-CodeRefine: Complete AI Code Review & Execution Platform
-Features: Signup/Signin, Code Execution, Error Detection, Complexity Analysis
-UPDATED: Fixed Quick Results + Professional CSS
-"""
-
-import gradio as gr
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
-    print("Warning: Groq SDK not installed. Install with: pip install groq")
-
-import json
-import os
-from datetime import datetime
-import subprocess
-import sys
-import tempfile
-import re
-
-# User database
-USERS_FILE = "coderefine_users.json"
-users_db = {}
-
-if os.path.exists(USERS_FILE):
-    try:
-        with open(USERS_FILE, 'r') as f:
-            users_db = json.load(f)
-    except:
-        users_db = {}
-
-# Initialize
-client = None
-current_user = None
-analysis_history = []
-
-def save_users():
-    """Save users to file"""
-    try:
-        with open(USERS_FILE, 'w') as f:
-            json.dump(users_db, f, indent=2)
-    except Exception as e:
-        print(f"Error saving users: {e}")
-
-def signup(username, password, confirm_password):
-    """User signup"""
-    if not username or not password:
-        return "❌ Username and password are required!", None
-    
-    if password != confirm_password:
-        return "❌ Passwords do not match!", None
-    
-    if len(password) < 6:
-        return "❌ Password must be at least 6 characters!", None
-    
-    if username in users_db:
-        return "❌ Username already exists! Please login.", None
-    
-    users_db[username] = {
-        "password": password,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "analyses_count": 0
-    }
-    save_users()
-    
-    return f"✅ Account created successfully! Welcome {username}!", gr.update(visible=True)
-
-def login(username, password):
-    """User login"""
-    global current_user
-    
-    if not username or not password:
-        return "❌ Username and password are required!", None, None
-    
-    if username not in users_db:
-        return "❌ User not found! Please signup first.", None, None
-    
-    if users_db[username]["password"] != password:
-        return "❌ Incorrect password!", None, None
-    
-    current_user = username
-    return f"✅ Welcome back, {username}!", gr.update(visible=True), gr.update(visible=False)
-
-def logout():
-    """User logout"""
-    global current_user
-    current_user = None
-    return gr.update(visible=False), gr.update(visible=True)
-
-def initialize_groq(api_key):
-    """Initialize Groq client"""
-    global client
-    
-    if not GROQ_AVAILABLE:
-        return "❌ Error: Groq SDK not installed. Run: pip install groq"
-    
-    try:
-        if not api_key or not api_key.strip():
-            return "⚠️ Please enter a valid API key"
-        
-        client = Groq(api_key=api_key.strip())
-        return "✅ API Key configured successfully!"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
-
-def run_code(code, language):
-    """Execute code and return output"""
-    try:
-        if not code.strip():
-            return "⚠️ No code to run!", ""
-        
-        if language == "Python":
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-            
-            try:
-                result = subprocess.run(
-                    [sys.executable, temp_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                output = result.stdout if result.stdout else ""
-                error = result.stderr if result.stderr else ""
-                
-                if result.returncode == 0:
-                    return f"✅ Execution Successful\n\n{output}", output
-                else:
-                    return f"❌ Execution Failed\n\n{error}", error
-            finally:
-                os.unlink(temp_file)
-        
-        elif language == "JavaScript":
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-            
-            try:
-                result = subprocess.run(
-                    ['node', temp_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                output = result.stdout if result.stdout else ""
-                error = result.stderr if result.stderr else ""
-                
-                if result.returncode == 0:
-                    return f"✅ Execution Successful\n\n{output}", output
-                else:
-                    return f"❌ Execution Failed\n\n{error}", error
-            except FileNotFoundError:
-                return "❌ Node.js not installed! Only Python execution is available.", ""
-            finally:
-                os.unlink(temp_file)
-        
-        else:
-            return f"⚠️ Code execution for {language} is not supported yet. Only Python and JavaScript are supported.", ""
-    
-    except subprocess.TimeoutExpired:
-        return "❌ Execution timeout! Code took too long to run.", ""
-    except Exception as e:
-        return f"❌ Execution error: {str(e)}", ""
-
-def analyze_code_short(code, language, api_key):
-    """Quick analysis with error detection and corrected code"""
-    global client, current_user
-    
-    if not current_user:
-        return "⚠️ Please login first!", "⚠️ Login Required", "", "", "⚠️ Login Required"
-    
-    try:
-        if not client and api_key:
-            init_result = initialize_groq(api_key)
-            if "❌" in init_result or "⚠️" in init_result:
-                return init_result, "⚠️ API Key Required", "", "", "⚠️ Configure API Key"
-        
-        if not client:
-            return "⚠️ Please set your Groq API key first!", "⚠️ API Key Required", "", "", "⚠️ Configure API Key"
-        
-        if not code.strip():
-            return "⚠️ Please enter code to analyze!", "⚠️ No Code", "", "", "⚠️ Code Required"
-        
-        system_prompt = f"""You are CodeRefine, an expert code analyzer.
-Analyze {language} code and provide a SHORT, CONCISE response with:
-1. ERROR STATUS: "NO ERRORS" or "ERRORS FOUND"
-2. If errors found, provide CORRECTED CODE
-3. TIME COMPLEXITY (Big O)
-4. SPACE COMPLEXITY (Big O)
-5. Brief explanation (max 2 sentences)
-
-Be direct and concise."""
-
-        user_prompt = f"""Analyze this {language} code:
-
-```{language.lower()}
-{code}
-```
-
-Provide response in this EXACT format:
-
-**ERROR STATUS:** [NO ERRORS / ERRORS FOUND]
-
-**ISSUES:** [List issues briefly, or "None"]
-
-**CORRECTED CODE:**
-```{language.lower()}
-[corrected code or "No corrections needed"]
-```
-
-**TIME COMPLEXITY:** O(?)
-**SPACE COMPLEXITY:** O(?)
-
-**EXPLANATION:** [1-2 sentences only]"""
-
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.2,
-            max_tokens=1500,
-        )
-        
-        analysis = chat_completion.choices[0].message.content
-        
-        # Parse error status
-        if "NO ERRORS" in analysis.upper() and "ERRORS FOUND" not in analysis.upper():
-            error_status = "✅ NO ERRORS DETECTED"
-        else:
-            error_status = "❌ ERRORS FOUND"
-        
-        # Extract corrected code
-        corrected_code = ""
-        code_match = re.search(r'```[\w]*\n(.*?)\n```', analysis, re.DOTALL)
-        if code_match:
-            corrected_code = code_match.group(1).strip()
-            if "no correction" in corrected_code.lower():
-                corrected_code = "No corrections needed - code is clean!"
-        else:
-            corrected_code = "No corrections needed"
-        
-        # Extract complexities
-        time_complexity = "Not analyzed"
-        space_complexity = "Not analyzed"
-        
-        time_match = re.search(r'TIME COMPLEXITY[:\s]+O\(([^)]+)\)', analysis, re.IGNORECASE)
-        if time_match:
-            time_complexity = f"O({time_match.group(1).strip()})"
-        
-        space_match = re.search(r'SPACE COMPLEXITY[:\s]+O\(([^)]+)\)', analysis, re.IGNORECASE)
-        if space_match:
-            space_complexity = f"O({space_match.group(1).strip()})"
-        
-        complexity_display = f"⏱️ Time: {time_complexity}  |  💾 Space: {space_complexity}"
-        
-        # Update user stats
-        if current_user in users_db:
-            users_db[current_user]["analyses_count"] = users_db[current_user].get("analyses_count", 0) + 1
-            save_users()
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        status_display = f"✅ Completed at {timestamp}"
-        
-        return analysis, error_status, corrected_code, complexity_display, status_display
-        
-    except Exception as e:
-        return f"❌ Error: {str(e)}", "❌ ANALYSIS FAILED", "", "", f"❌ Failed: {str(e)}"
-
-def run_and_analyze(code, language, api_key):
-    """Run code and analyze it"""
-    analysis, error_status, corrected, complexity, status = analyze_code_short(code, language, api_key)
-    run_output, _ = run_code(code, language)
-    
-    return analysis, error_status, corrected, complexity, status, run_output
-
-# Professional CSS
-custom_css = """
-@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap');
-
-* {
-    font-family: 'Poppins', -apple-system, BlinkMacSystemFont, sans-serif !important;
-}
-
-.gradio-container {
-    max-width: 1600px !important;
-    margin: 0 auto !important;
-}
-
-/* Header Styling */
-.main-header {
-    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #7e22ce 100%);
-    padding: 50px 30px;
-    border-radius: 20px;
-    text-align: center;
-    color: white;
-    margin-bottom: 30px;
-    box-shadow: 0 20px 60px rgba(30, 60, 114, 0.3);
-    position: relative;
-    overflow: hidden;
-}
-
-.main-header::before {
-    content: '';
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
-    animation: shine 3s infinite;
-}
-
-@keyframes shine {
-    0%, 100% { transform: translateX(-100%); }
-    50% { transform: translateX(100%); }
-}
-
-.main-header h1 {
-    font-size: 3.5em;
-    font-weight: 700;
-    margin: 0 0 15px 0;
-    text-shadow: 2px 2px 8px rgba(0,0,0,0.3);
-    letter-spacing: -1px;
-}
-
-.main-header h3 {
-    font-size: 1.4em;
-    font-weight: 400;
-    margin: 0 0 10px 0;
-    opacity: 0.95;
-}
-
-.main-header p {
-    font-size: 1.1em;
-    opacity: 0.9;
-    margin: 0;
-}
-
-/* Auth Container */
-.auth-box {
-    background: white;
-    border-radius: 20px;
-    padding: 40px;
-    box-shadow: 0 15px 50px rgba(0,0,0,0.1);
-    max-width: 500px;
-    margin: 50px auto;
-}
-
-/* Quick Results Cards */
-.results-card {
-    background: linear-gradient(135deg, #f6f8fb 0%, #e9ecef 100%);
-    border-radius: 15px;
-    padding: 20px;
-    margin: 10px 0;
-    border-left: 5px solid #1e3c72;
-    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-    transition: all 0.3s ease;
-}
-
-.results-card:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 8px 25px rgba(0,0,0,0.12);
-}
-
-.status-success {
-    background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-    border-left-color: #28a745;
-    color: #155724;
-}
-
-.status-error {
-    background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-    border-left-color: #dc3545;
-    color: #721c24;
-}
-
-.status-warning {
-    background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-    border-left-color: #ffc107;
-    color: #856404;
-}
-
-/* Buttons */
-.gr-button {
-    border-radius: 12px !important;
-    font-weight: 600 !important;
-    padding: 12px 24px !important;
-    transition: all 0.3s ease !important;
-    border: none !important;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-    font-size: 0.9em !important;
-}
-
-.gr-button-primary {
-    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%) !important;
-    color: white !important;
-    box-shadow: 0 4px 15px rgba(30, 60, 114, 0.4) !important;
-}
-
-.gr-button-primary:hover {
-    transform: translateY(-2px) !important;
-    box-shadow: 0 8px 25px rgba(30, 60, 114, 0.5) !important;
-}
-
-.gr-button-secondary {
-    background: linear-gradient(135deg, #6c757d 0%, #495057 100%) !important;
-    color: white !important;
-}
-
-/* Input Fields */
-.gr-input, .gr-textbox, .gr-dropdown {
-    border-radius: 10px !important;
-    border: 2px solid #e0e6ed !important;
-    padding: 12px !important;
-    transition: all 0.3s ease !important;
-}
-
-.gr-input:focus, .gr-textbox:focus, .gr-dropdown:focus {
-    border-color: #1e3c72 !important;
-    box-shadow: 0 0 0 3px rgba(30, 60, 114, 0.1) !important;
-}
-
-/* Code Editor */
-.gr-code {
-    border-radius: 12px !important;
-    border: 2px solid #e0e6ed !important;
-    overflow: hidden;
-    box-shadow: 0 5px 20px rgba(0,0,0,0.08) !important;
-}
-
-/* Tabs */
-.gr-tab {
-    border-radius: 10px 10px 0 0 !important;
-    font-weight: 600 !important;
-    padding: 12px 24px !important;
-    transition: all 0.3s ease !important;
-}
-
-.gr-tab-selected {
-    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%) !important;
-    color: white !important;
-}
-
-/* Cards and Panels */
-.gr-panel {
-    border-radius: 15px !important;
-    border: none !important;
-    box-shadow: 0 5px 20px rgba(0,0,0,0.08) !important;
-}
-
-/* Section Headers */
-.section-header {
-    background: linear-gradient(90deg, #1e3c72 0%, transparent 100%);
-    color: white;
-    padding: 15px 25px;
-    border-radius: 10px;
-    margin: 20px 0 15px 0;
-    font-weight: 600;
-    font-size: 1.2em;
-}
-
-/* Status Badges */
-.status-badge {
-    display: inline-block;
-    padding: 8px 16px;
-    border-radius: 20px;
-    font-weight: 600;
-    font-size: 0.95em;
-    text-align: center;
-}
-
-/* Animations */
-@keyframes fadeIn {
-    from { opacity: 0; transform: translateY(20px); }
-    to { opacity: 1; transform: translateY(0); }
-}
-
-.fade-in {
-    animation: fadeIn 0.5s ease;
-}
-
-/* Footer */
-.footer {
-    text-align: center;
-    padding: 30px;
-    margin-top: 50px;
-    border-top: 2px solid #e0e6ed;
-    color: #6c757d;
-}
-
-/* Scrollbar */
-::-webkit-scrollbar {
-    width: 10px;
-    height: 10px;
-}
-
-::-webkit-scrollbar-track {
-    background: #f1f3f5;
-    border-radius: 10px;
-}
-
-::-webkit-scrollbar-thumb {
-    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-    border-radius: 10px;
-}
-
-::-webkit-scrollbar-thumb:hover {
-    background: linear-gradient(135deg, #2a5298 0%, #1e3c72 100%);
-}
-"""
-
-# Build the app
-with gr.Blocks(title="CodeRefine - Professional Code Analysis") as app:
-    
-    # Authentication Pages
-    with gr.Column(visible=True) as auth_page:
-        gr.HTML("""
-        <div class="main-header">
-            <h1>🚀 CodeRefine</h1>
-            <h3>Professional AI Code Analysis & Execution Platform</h3>
-            <p>Instant Error Detection • Auto-Correction • Complexity Analysis • Code Execution</p>
-        </div>
-        """)
-        
-        with gr.Row():
-            with gr.Column(scale=1):
-                gr.Markdown("")
-            with gr.Column(scale=2):
-                with gr.Tabs():
-                    with gr.Tab("🔐 Login"):
-                        gr.Markdown("### Welcome Back!")
-                        login_username = gr.Textbox(label="Username", placeholder="Enter your username")
-                        login_password = gr.Textbox(label="Password", type="password", placeholder="Enter your password")
-                        login_btn = gr.Button("🚀 Login", variant="primary", size="lg")
-                        login_status = gr.Textbox(label="Status", interactive=False)
-                    
-                    with gr.Tab("📝 Sign Up"):
-                        gr.Markdown("### Create Your Account")
-                        signup_username = gr.Textbox(label="Username", placeholder="Choose a unique username")
-                        signup_password = gr.Textbox(label="Password", type="password", placeholder="Min 6 characters")
-                        signup_confirm = gr.Textbox(label="Confirm Password", type="password", placeholder="Re-enter password")
-                        signup_btn = gr.Button("✨ Create Account", variant="primary", size="lg")
-                        signup_status = gr.Textbox(label="Status", interactive=False)
-            with gr.Column(scale=1):
-                gr.Markdown("")
-    
-    # Main Application
-    with gr.Column(visible=False) as main_page:
-        gr.HTML("""
-        <div class="main-header">
-            <h1>🚀 CodeRefine</h1>
-            <h3>Professional Code Analysis Platform</h3>
-            <p>AI-Powered Error Detection • Auto-Correction • Complexity Analysis • Live Execution</p>
-        </div>
-        """)
-        
-        with gr.Row():
-            with gr.Column(scale=4):
-                gr.Markdown("### 👤 Session Active")
-            with gr.Column(scale=1):
-                logout_btn = gr.Button("🚪 Logout", size="sm", variant="secondary")
-        
-        gr.Markdown("---")
-        
-        # API Key Section
-        with gr.Row():
-            with gr.Column(scale=3):
-                api_key_input = gr.Textbox(
-                    label="🔑 Groq API Key",
-                    placeholder="Get your free API key from console.groq.com",
-                    type="password"
-                )
-            with gr.Column(scale=2):
-                api_status = gr.Textbox(label="🔌 Connection Status", value="⚪ Not Connected", interactive=False)
-            with gr.Column(scale=1):
-                set_api_btn = gr.Button("Connect", variant="primary", size="lg")
-        
-        set_api_btn.click(
-            fn=initialize_groq,
-            inputs=[api_key_input],
-            outputs=[api_status]
-        )
-        
-        gr.Markdown("---")
-        
-        # Main Interface
-        with gr.Row():
-            # Left: Code Input
-            with gr.Column(scale=3):
-                gr.Markdown("### 📝 Code Editor")
-                code_input = gr.Code(
-                    label="",
-                    language="python",
-                    lines=22
-                )
-                
-                language_select = gr.Dropdown(
-                    choices=["Python", "JavaScript", "Java", "C++", "C#", "Go", "TypeScript", "Ruby", "PHP"],
-                    value="Python",
-                    label="Programming Language"
-                )
-                
-                with gr.Row():
-                    analyze_btn = gr.Button("🔍 Analyze", variant="primary", size="lg", scale=1)
-                    run_btn = gr.Button("▶️ Run", variant="secondary", size="lg", scale=1)
-                    both_btn = gr.Button("🚀 Analyze & Run", variant="primary", size="lg", scale=2)
-            
-            # Right: Quick Results
-            with gr.Column(scale=2):
-                gr.Markdown("### 📊 Quick Results")
-                
-                error_status_output = gr.Textbox(
-                    label="",
-                    value="⚪ Waiting for analysis...",
-                    interactive=False,
-                    lines=2,
-                    elem_classes="results-card"
-                )
-                
-                complexity_output = gr.Textbox(
-                    label="",
-                    value="⏱️ Time: - | 💾 Space: -",
-                    interactive=False,
-                    lines=2,
-                    elem_classes="results-card"
-                )
-                
-                status_output = gr.Textbox(
-                    label="",
-                    value="⏳ Ready to analyze",
-                    interactive=False,
-                    lines=2,
-                    elem_classes="results-card"
-                )
-        
-        gr.Markdown("---")
-        
-        # Results Tabs
-        with gr.Tabs():
-            with gr.Tab("📊 Full Analysis"):
-                analysis_output = gr.Markdown(value="*Analysis results will appear here...*")
-            
-            with gr.Tab("✅ Corrected Code"):
-                corrected_output = gr.Code(
-                    label="",
-                    language="python",
-                    lines=15,
-                    value="# Corrected code will appear here after analysis"
-                )
-            
-            with gr.Tab("▶️ Execution Output"):
-                run_output = gr.Textbox(
-                    label="",
-                    lines=15,
-                    interactive=False,
-                    value="Code execution output will appear here..."
-                )
-        
-        gr.Markdown("---")
-        
-        # Examples
-        gr.Markdown("### 📚 Try These Examples (with intentional errors)")
-        gr.Examples(
-            examples=[
-                ["""def factorial(n):
-    if n = 1:  # Error: = should be ==
-        return 1
-    return n * factorial(n-1)
-
-print(factorial(5))""", "Python"],
-                ["""def bubble_sort(arr):
-    n = len(arr)
-    for i in range(n):
-        for j in range(0, n-i-1):
-            if arr[j] > arr[j+1]:
-                arr[j], arr[j+1] = arr[j+1], arr[j]
-    return arr
-
-print(bubble_sort([64, 34, 25, 12, 22]))""", "Python"],
-                ["""function sum(a, b) {
-    return a + b
-}
-console.log(sum(10, 20))""", "JavaScript"],
-            ],
-            inputs=[code_input, language_select]
-        )
-        
-        # Event handlers
-        analyze_btn.click(
-            fn=analyze_code_short,
-            inputs=[code_input, language_select, api_key_input],
-            outputs=[analysis_output, error_status_output, corrected_output, complexity_output, status_output]
-        )
-        
-        run_btn.click(
-            fn=run_code,
-            inputs=[code_input, language_select],
-            outputs=[run_output, gr.Textbox(visible=False)]
-        )
-        
-        both_btn.click(
-            fn=run_and_analyze,
-            inputs=[code_input, language_select, api_key_input],
-            outputs=[analysis_output, error_status_output, corrected_output, complexity_output, status_output, run_output]
-        )
-        
-        # Footer
-        gr.HTML("""
-        <div class="footer">
-            <p style="font-size: 1.1em; font-weight: 600; margin-bottom: 10px;">
-                Built with ❤️ using Gradio & Groq
-            </p>
-            <p style="margin: 5px 0;">CodeRefine v3.0 Professional Edition</p>
-            <p style="color: #999;">Powered by Llama 3.3 70B Versatile</p>
-        </div>
-        """)
-    
-    # Authentication handlers
-    login_btn.click(
-        fn=login,
-        inputs=[login_username, login_password],
-        outputs=[login_status, main_page, auth_page]
-    )
-    
-    signup_btn.click(
-        fn=signup,
-        inputs=[signup_username, signup_password, signup_confirm],
-        outputs=[signup_status, main_page]
-    )
-    
-    logout_btn.click(
-        fn=logout,
-        outputs=[main_page, auth_page]
-    )
-
-# Launch
-if __name__ == "__main__":
-    print("=" * 80)
-    print("🚀 CodeRefine v3.0 - Professional Code Analysis Platform")
-    print("=" * 80)
-    print("✨ Features:")
-    print("   ✅ User Authentication (Signup/Login)")
-    print("   ✅ Error Detection with Auto-Correction")
-    print("   ✅ Time & Space Complexity Analysis")
-    print("   ✅ Live Code Execution (Python & JavaScript)")
-    print("   ✅ Professional UI with Modern Design")
-    print("   ✅ Quick Results Display (UPDATED)")
-    print("=" * 80)
-    print("📍 Server: http://127.0.0.1:7860")
-    print("🔑 Get Free API Key: https://console.groq.com")
-    print("=" * 80)
-    
-    app.launch(
-        share=False,
-        server_name="127.0.0.1",
-        server_port=7860,
-        show_error=True,
-        css=custom_css
+"""
+CodeRefine: Complete AI Code Review & Execution Platform
+Features: Signup/Signin, Code Execution, Error Detection, Complexity Analysis
+UPDATED: Fixed Quick Results + Professional CSS
+"""
+
+import gradio as gr
+import importlib.util
+
+# Availability check only; the actual import happens lazily in _get_client so
+# interpreter start (and Gradio boot) doesn't pay for it
+GROQ_AVAILABLE = importlib.util.find_spec("groq") is not None
+if not GROQ_AVAILABLE:
+    print("Warning: Groq SDK not installed. Install with: pip install groq")
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False
+
+try:
+    import chromadb
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+import ast
+import asyncio
+import atexit
+import hashlib
+import hmac
+import itertools
+import sqlite3
+import threading
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+import random
+import signal
+import subprocess
+import sys
+import re
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+# User database: SQLite with WAL, indexed by username, passwords stored hashed.
+# The legacy JSON file is imported on first run.
+USERS_FILE = "coderefine_users.json"
+USERS_DB_FILE = "coderefine_users.db"
+
+_users_conn = None
+_users_lock = threading.Lock()
+
+def _hash_password(password):
+    """Hash a password with bcrypt, or salted scrypt when bcrypt is missing"""
+    if BCRYPT_AVAILABLE:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=10))
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1)
+    return b"scrypt$" + salt + digest
+
+def _verify_password(password, pwhash):
+    """Constant-time check of a password against a stored hash"""
+    pwhash = bytes(pwhash)
+    if pwhash.startswith(b"scrypt$"):
+        salt, digest = pwhash[7:23], pwhash[23:]
+        candidate = hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1)
+        return hmac.compare_digest(candidate, digest)
+    if BCRYPT_AVAILABLE:
+        return bcrypt.checkpw(password.encode(), pwhash)
+    return False
+
+def _migrate_legacy_users(conn):
+    """Import the old JSON users file, hashing its plaintext passwords"""
+    if not os.path.exists(USERS_FILE):
+        return
+    try:
+        with open(USERS_FILE, 'rb') as f:
+            raw = f.read()
+        legacy = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except Exception as e:
+        print(f"Warning: could not migrate {USERS_FILE}: {e}")
+        return
+
+    for username, record in legacy.items():
+        conn.execute(
+            "INSERT OR IGNORE INTO users(username, pwhash, created_at, analyses_count) VALUES (?, ?, ?, ?)",
+            (
+                username,
+                _hash_password(record.get("password", "")),
+                record.get("created_at", ""),
+                record.get("analyses_count", 0)
+            )
+        )
+    conn.commit()
+    os.replace(USERS_FILE, USERS_FILE + ".migrated")
+
+def _get_users_conn():
+    """Open (once) the users database, creating the schema if needed"""
+    global _users_conn
+    if _users_conn is None:
+        conn = sqlite3.connect(USERS_DB_FILE, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA page_size=16384")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS users("
+            "username TEXT PRIMARY KEY, "
+            "pwhash BLOB NOT NULL, "
+            "created_at TEXT NOT NULL, "
+            "analyses_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.commit()
+        _migrate_legacy_users(conn)
+        _users_conn = conn
+    return _users_conn
+
+def _close_users_conn():
+    if _users_conn is not None:
+        _users_conn.close()
+
+atexit.register(_close_users_conn)
+
+def record_analysis(username):
+    """Bump a user's completed-analysis counter"""
+    with _users_lock:
+        conn = _get_users_conn()
+        conn.execute("UPDATE users SET analyses_count = analyses_count + 1 WHERE username = ?", (username,))
+        conn.commit()
+
+# Login and client state live in per-session gr.State components built inside
+# the Blocks context below; module globals here would be shared by every
+# connected browser, so two users would overwrite each other's session
+
+# Prompt templates built once at import; the invariant instructions come first and
+# the dynamic code block last, so providers with prompt-prefix caching can reuse
+# the KV cache for the shared leading tokens across requests
+SYSTEM_PROMPT = """You are CodeRefine, an expert code analyzer.
+Be direct and concise. Respond in this EXACT format:
+
+**ERROR STATUS:** [NO ERRORS / ERRORS FOUND]
+
+**ISSUES:** [List issues briefly, or "None"]
+
+**CORRECTED CODE:**
+```
+[corrected code or "No corrections needed"]
+```
+
+**TIME COMPLEXITY:** O(?)
+**SPACE COMPLEXITY:** O(?)
+
+**EXPLANATION:** [1-2 sentences only]"""
+
+USER_PROMPT_TEMPLATE = """Analyze this {language} code:
+
+```{language_tag}
+{code}
+```"""
+
+# Model used for all completions
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Client-side ceiling on simultaneous Groq requests, to stay under the API rate limit
+GROQ_MAX_CONCURRENCY = 8
+_groq_semaphore = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+# Request-rate smoothing and retry policy for the free-tier quota (~25 RPM)
+GROQ_REQUESTS_PER_SEC = 0.4
+GROQ_BURST = 5
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 20.0
+
+class TokenBucket:
+    """Client-side token bucket smoothing request rate to the provider quota"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+_groq_bucket = TokenBucket(GROQ_REQUESTS_PER_SEC, GROQ_BURST)
+
+def _is_rate_limit_error(e):
+    """Classify provider errors that should be retried after a pause"""
+    if getattr(e, "status_code", None) == 429:
+        return True
+    text = str(e).lower()
+    return "rate limit" in text or "429" in text or "quota" in text
+
+def _retry_after_seconds(e):
+    """Honor the Retry-After header when the provider sends one"""
+    response = getattr(e, "response", None)
+    if response is not None:
+        try:
+            return float(response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+    return None
+
+async def _groq_create(client, **kwargs):
+    """Rate-limited chat.completions.create with exponential backoff on 429s"""
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        await _groq_bucket.acquire()
+        try:
+            async with _groq_semaphore:
+                return await client.chat.completions.create(**kwargs)
+        except Exception as e:
+            if not _is_rate_limit_error(e) or attempt == RETRY_MAX_ATTEMPTS - 1:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.random() * 0.1
+            await asyncio.sleep(delay)
+
+# Languages offered in the editor dropdown; frozen so UI builds just reference it
+LANGUAGES = ("Python", "JavaScript", "Java", "C++", "C#", "Go", "TypeScript", "Ruby", "PHP")
+
+# Inputs above this size are split and analyzed as parallel chunks
+LARGE_CODE_THRESHOLD = 4000
+
+def split_python_code(code):
+    """Split Python source into top-level function/class chunks; [] if unsplittable"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return []
+
+    chunks = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            segment = ast.get_source_segment(code, node)
+            if segment:
+                chunks.append(segment)
+    return chunks
+
+# Streaming UI updates are debounced: re-rendering the whole markdown pane per
+# token costs the frontend O(chunks x length), so flush on size or time instead
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_INTERVAL = 0.1
+
+# Output-token caps by input size; generation time scales with the cap,
+# and short snippets never need the full budget
+MAX_TOKENS_STEPS = ((500, 384), (2000, 512), (8000, 600))
+MAX_TOKENS_DEFAULT = 600
+
+def max_tokens_for(code):
+    """Pick an output-token cap proportional to the size of the submitted code"""
+    size = len(code)
+    for limit, cap in MAX_TOKENS_STEPS:
+        if size <= limit:
+            return cap
+    return MAX_TOKENS_DEFAULT
+
+# Exact-match cache: identical resubmissions skip the API entirely. Bounded LRU
+# with TTL, backed by an optional on-disk cache so hits survive process restarts.
+EXACT_CACHE_TTL = 1800
+EXACT_CACHE_MAX = 1000
+_exact_cache = OrderedDict()
+
+DISK_CACHE_DIR = "./.coderefine_cache"
+DISK_CACHE_TTL = 86400
+DISK_CACHE_SIZE_LIMIT = int(2e9)
+_disk_cache = None
+
+def _get_disk_cache():
+    """Lazily open the on-disk cache; returns None if unavailable"""
+    global _disk_cache
+    if not DISKCACHE_AVAILABLE:
+        return None
+
+    if _disk_cache is None:
+        try:
+            _disk_cache = diskcache.Cache(DISK_CACHE_DIR, size_limit=DISK_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            print(f"Warning: disk cache disabled: {e}")
+            return None
+
+    return _disk_cache
+
+def _exact_cache_key(language, code):
+    """Deterministic hash key for a language+code submission"""
+    return hashlib.blake2b(f"{language}|{code}".encode(), digest_size=16).hexdigest()
+
+def exact_cache_lookup(language, code):
+    """Return a cached analysis for an identical submission, or None"""
+    key = _exact_cache_key(language, code)
+    hit = _exact_cache.get(key)
+    if hit:
+        if time.time() - hit[0] < EXACT_CACHE_TTL:
+            _exact_cache.move_to_end(key)
+            return hit[1]
+        del _exact_cache[key]
+
+    disk = _get_disk_cache()
+    if disk is not None:
+        cached = disk.get(key)
+        if cached is not None:
+            _exact_cache[key] = (time.time(), cached)
+            return cached
+
+    return None
+
+def exact_cache_store(language, code, analysis):
+    """Store a completed analysis under its exact-match key"""
+    key = _exact_cache_key(language, code)
+    _exact_cache[key] = (time.time(), analysis)
+    _exact_cache.move_to_end(key)
+
+    # Evict the oldest 20% in one pass once the cap is hit
+    if len(_exact_cache) > EXACT_CACHE_MAX:
+        for _ in range(EXACT_CACHE_MAX // 5):
+            _exact_cache.popitem(last=False)
+
+    disk = _get_disk_cache()
+    if disk is not None:
+        disk.set(key, analysis, expire=DISK_CACHE_TTL)
+
+def clear_analysis_cache():
+    """Empty the exact-match cache (in-memory and on-disk)"""
+    _exact_cache.clear()
+    disk = _get_disk_cache()
+    if disk is not None:
+        disk.clear()
+    return "🧹 Analysis cache cleared"
+
+# Semantic cache (optional): reuse stored analyses for near-identical
+# submissions. Model load and encode are CPU-bound (the load may even download
+# weights), so async callers must reach these through asyncio.to_thread
+SEMANTIC_CACHE_MAX_DISTANCE = 0.15
+_semantic_embedder = None
+_semantic_collection = None
+_semantic_lock = threading.Lock()
+
+def _get_semantic_cache():
+    """Lazily build the embedder + vector collection; returns None if unavailable"""
+    global _semantic_embedder, _semantic_collection
+
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None
+
+    with _semantic_lock:
+        if _semantic_collection is None:
+            try:
+                _semantic_embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+                _semantic_collection = chromadb.Client().get_or_create_collection("coderefine")
+            except Exception as e:
+                print(f"Warning: semantic cache disabled: {e}")
+                return None
+
+    return _semantic_embedder, _semantic_collection
+
+def semantic_cache_lookup(language, code):
+    """Return a cached analysis for near-identical code, or None on miss"""
+    cache = _get_semantic_cache()
+    if not cache:
+        return None
+
+    embedder, collection = cache
+    if collection.count() == 0:
+        return None
+
+    try:
+        emb = embedder.encode(f"{language}|{code}").tolist()
+        res = collection.query(query_embeddings=[emb], n_results=1)
+        if res["distances"][0] and res["distances"][0][0] <= SEMANTIC_CACHE_MAX_DISTANCE:
+            return res["metadatas"][0][0]["analysis"]
+    except Exception as e:
+        print(f"Warning: semantic cache lookup failed: {e}")
+
+    return None
+
+def semantic_cache_store(language, code, analysis):
+    """Store a completed analysis keyed by the embedding of language+code"""
+    cache = _get_semantic_cache()
+    if not cache:
+        return
+
+    embedder, collection = cache
+    try:
+        emb = embedder.encode(f"{language}|{code}").tolist()
+        collection.add(
+            embeddings=[emb],
+            metadatas=[{"analysis": analysis}],
+            ids=[uuid.uuid4().hex]
+        )
+    except Exception as e:
+        print(f"Warning: semantic cache store failed: {e}")
+
+def signup(username, password, confirm_password):
+    """User signup"""
+    if not username or not password:
+        return "❌ Username and password are required!", None
+
+    if password != confirm_password:
+        return "❌ Passwords do not match!", None
+
+    if len(password) < 6:
+        return "❌ Password must be at least 6 characters!", None
+
+    with _users_lock:
+        conn = _get_users_conn()
+        try:
+            conn.execute(
+                "INSERT INTO users(username, pwhash, created_at) VALUES (?, ?, ?)",
+                (username, _hash_password(password), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            conn.commit()
+        except sqlite3.IntegrityError:
+            return "❌ Username already exists! Please login.", None
+
+    return f"✅ Account created successfully! Welcome {username}!", gr.update(visible=True)
+
+def login(username, password):
+    """User login; returns the logged-in username as the session state"""
+    if not username or not password:
+        return "❌ Username and password are required!", None, None, None
+
+    with _users_lock:
+        row = _get_users_conn().execute(
+            "SELECT pwhash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+
+    if row is None:
+        return "❌ User not found! Please signup first.", None, None, None
+
+    if not _verify_password(password, row[0]):
+        return "❌ Incorrect password!", None, None, None
+
+    return f"✅ Welcome back, {username}!", gr.update(visible=True), gr.update(visible=False), username
+
+def logout():
+    """User logout; clears the session's user and client state"""
+    return gr.update(visible=False), gr.update(visible=True), None, None
+
+# Shared HTTP connection pool: keep-alive + HTTP/2 sockets survive API-key changes
+_http_client = None
+
+def _get_http_client():
+    """Build the pooled httpx client once and reuse it for every Groq client"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        limits = httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=30,
+        )
+        try:
+            _http_client = httpx.AsyncClient(http2=True, limits=limits, timeout=60)
+        except ImportError:
+            # http2=True needs the optional h2 package (httpx[http2]); fall
+            # back to HTTP/1.1 keep-alive rather than failing every request
+            _http_client = httpx.AsyncClient(limits=limits, timeout=60)
+    return _http_client
+
+def _close_http_client():
+    """Close pooled connections cleanly on interpreter shutdown"""
+    if _http_client is not None:
+        try:
+            asyncio.run(_http_client.aclose())
+        except Exception:
+            pass
+
+atexit.register(_close_http_client)
+
+@lru_cache(maxsize=4)
+def _get_client(api_key):
+    """Build (and memoize) an AsyncGroq client for an API key"""
+    from groq import AsyncGroq
+    return AsyncGroq(api_key=api_key, http_client=_get_http_client())
+
+def initialize_groq(api_key):
+    """Initialize the Groq client for this session; returns (status, client)"""
+    if not GROQ_AVAILABLE:
+        return "❌ Error: Groq SDK not installed. Run: pip install groq", None
+
+    try:
+        if not api_key or not api_key.strip():
+            return "⚠️ Please enter a valid API key", None
+
+        return "✅ API Key configured successfully!", _get_client(api_key.strip())
+    except Exception as e:
+        return f"❌ Error: {str(e)}", None
+
+async def _groq_chat(client, messages, max_tokens):
+    """Single non-streamed completion; returns the response text"""
+    completion = await _groq_create(
+        client,
+        messages=messages,
+        model=GROQ_MODEL,
+        temperature=0.2,
+        max_tokens=max_tokens,
+    )
+    return completion.choices[0].message.content
+
+# Asynchronous request batching: analyses that arrive while another one is
+# already streaming are collected for a short window and sent as one
+# multi-snippet prompt, which counts as a single request against the provider
+# rate limit. Solo requests keep the streaming path; batched ones trade the
+# progressive render for N-fold rate-limit headroom under load.
+BATCH_WINDOW = 0.25
+BATCH_MAX_ITEMS = 5
+
+BATCH_SYSTEM_SUFFIX = """
+
+You will be given several numbered code snippets. Analyze each one
+independently in the format above, starting each analysis with a line
+containing exactly: ### RESULT <number> ###"""
+
+_batch_queue = None
+_batch_task = None
+_active_streams = 0  # solo analyses currently streaming on this loop
+
+_BATCH_RESULT_RE = re.compile(r"^###\s*RESULT\s+(\d+)\s*###\s*$", re.MULTILINE)
+
+def _split_batch_response(text, count):
+    """Split a batched response into per-snippet analyses, or None on mismatch"""
+    markers = list(_BATCH_RESULT_RE.finditer(text))
+    if len(markers) != count:
+        return None
+    sections = []
+    for i, m in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        sections.append(text[m.end():end].strip())
+    return sections
+
+async def _batch_drainer():
+    """Drain queued analyses every BATCH_WINDOW (or BATCH_MAX_ITEMS) as one call"""
+    while True:
+        items = [await _batch_queue.get()]
+        deadline = time.monotonic() + BATCH_WINDOW
+        while len(items) < BATCH_MAX_ITEMS:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Sessions hold per-key clients; never combine across clients or one
+        # user's code would be sent (and billed) under another user's API key
+        groups = {}
+        for item in items:
+            groups.setdefault(id(item[0]), []).append(item)
+
+        for group in groups.values():
+            try:
+                if len(group) == 1:
+                    await _dispatch_solo(group)
+                    continue
+
+                client = group[0][0]
+                blocks = [
+                    f"[{i + 1}]\n" + USER_PROMPT_TEMPLATE.format_map({
+                        "language": lang,
+                        "language_tag": lang.lower(),
+                        "code": snippet
+                    })
+                    for i, (_, lang, snippet, _) in enumerate(group)
+                ]
+                text = await _groq_chat(
+                    client,
+                    [
+                        {"role": "system", "content": SYSTEM_PROMPT + BATCH_SYSTEM_SUFFIX},
+                        {"role": "user", "content": f"Analyze these {len(group)} snippets:\n\n" + "\n\n".join(blocks)}
+                    ],
+                    max_tokens=sum(max_tokens_for(snippet) for _, _, snippet, _ in group),
+                )
+                sections = _split_batch_response(text, len(group))
+                if sections is None:
+                    # Model didn't honor the section markers; fall back to one
+                    # call per snippet rather than guessing at boundaries
+                    await _dispatch_solo(group)
+                    continue
+                for (_, _, _, future), section in zip(group, sections):
+                    if not future.done():
+                        future.set_result(section)
+            except Exception as e:
+                for _, _, _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+
+async def _dispatch_solo(items):
+    """Resolve queued items with one single-snippet call each"""
+    for client, language, code, future in items:
+        if future.done():
+            continue
+        try:
+            future.set_result(await _groq_chat(
+                client,
+                [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": USER_PROMPT_TEMPLATE.format_map({
+                        "language": language,
+                        "language_tag": language.lower(),
+                        "code": code
+                    })}
+                ],
+                max_tokens=max_tokens_for(code),
+            ))
+        except Exception as e:
+            future.set_exception(e)
+
+async def _analyze_via_batcher(client, language, code):
+    """Enqueue an analysis for the batch drainer and wait for its result"""
+    global _batch_queue, _batch_task
+    if _batch_queue is None:
+        _batch_queue = asyncio.Queue()
+        _batch_task = asyncio.create_task(_batch_drainer())
+    future = asyncio.get_running_loop().create_future()
+    _batch_queue.put_nowait((client, language, code, future))
+    return await future
+
+# Persistent interpreter pool: spawning a fresh python/node per run costs
+# 50-150 ms of interpreter cold start, which dominates short snippets. Workers
+# stay alive between runs and frame each execution with sentinel lines.
+EXEC_TIMEOUT = 5
+# Per-process limits for submitted code (POSIX only): bounds CPU, memory and the
+# ability to fork, so hostile snippets can't starve other users
+EXEC_CPU_SECONDS = 2
+EXEC_POOL_CPU_SECONDS = 60  # pool workers accumulate CPU across ~100 runs
+EXEC_MEMORY_BYTES = 256 << 20
+EXEC_NODE_HEAP_MB = 256  # Node memory is capped via --max-old-space-size
+
+def _sandbox_limits(cpu_seconds, language="Python"):
+    """preexec_fn applying rlimits in the child; None where unsupported"""
+    if not RESOURCE_AVAILABLE:
+        return None
+
+    # The memory/fork limits are Python-only: V8 reserves multi-GB virtual
+    # ranges at startup, so RLIMIT_AS aborts Node before user code runs (its
+    # heap is bounded with --max-old-space-size instead), and RLIMIT_NPROC
+    # counts threads on Linux, which blocks the worker threads V8/libuv spawn
+    # at boot for any non-root user (root is exempt from NPROC)
+    full_sandbox = language == "Python"
+
+    def set_limits():
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        if full_sandbox:
+            resource.setrlimit(resource.RLIMIT_AS, (EXEC_MEMORY_BYTES, EXEC_MEMORY_BYTES))
+            resource.setrlimit(resource.RLIMIT_NPROC, (1, 1))
+
+    return set_limits
+
+_EXEC_START = b"<<<CODEREFINE_START>>>"
+_EXEC_EXIT_PREFIX = b"<<<CODEREFINE_EXIT:"
+
+_PY_DRIVER = r'''
+import sys, traceback
+while True:
+    header = sys.stdin.buffer.readline()
+    if not header:
+        break
+    try:
+        size = int(header)
+    except ValueError:
+        continue
+    code = sys.stdin.buffer.read(size).decode()
+    print("<<<CODEREFINE_START>>>", flush=True)
+    status = 0
+    try:
+        exec(compile(code, "<submitted>", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    print("<<<CODEREFINE_EXIT:%d>>>" % status, flush=True)
+'''
+
+_NODE_DRIVER = r'''
+const vm = require("vm");
+let pending = Buffer.alloc(0);
+let expect = -1;
+process.stdin.on("data", (d) => {
+  pending = Buffer.concat([pending, d]);
+  for (;;) {
+    if (expect < 0) {
+      const nl = pending.indexOf(10);
+      if (nl < 0) return;
+      expect = parseInt(pending.slice(0, nl).toString(), 10);
+      pending = pending.slice(nl + 1);
+    }
+    if (pending.length < expect) return;
+    const code = pending.slice(0, expect).toString();
+    pending = pending.slice(expect);
+    expect = -1;
+    console.log("<<<CODEREFINE_START>>>");
+    let status = 0;
+    try {
+      vm.runInThisContext(code);
+    } catch (e) {
+      console.error(e.stack || String(e));
+      status = 1;
+    }
+    console.log("<<<CODEREFINE_EXIT:" + status + ">>>");
+  }
+});
+'''
+
+class InterpreterWorker:
+    """A long-lived interpreter process executing submissions over pipes"""
+
+    def __init__(self, language):
+        self.language = language
+        self.uses = 0
+        if language == "Python":
+            # -I (isolated mode) keeps user code from sys.path-hijacking the driver
+            cmd = [sys.executable, "-I", "-u", "-c", _PY_DRIVER]
+        else:
+            cmd = ["node", f"--max-old-space-size={EXEC_NODE_HEAP_MB}", "-e", _NODE_DRIVER]
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            close_fds=True,
+            start_new_session=True,
+            preexec_fn=_sandbox_limits(EXEC_POOL_CPU_SECONDS, language)
+        )
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def kill(self):
+        # Kill the whole session so children spawned by user code die too
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except (OSError, AttributeError):
+            self.proc.kill()
+        try:
+            self.proc.wait()
+        except Exception:
+            pass
+
+    def execute(self, code, timeout=EXEC_TIMEOUT):
+        """Run code in the worker; returns (output, exit_status)"""
+        payload = code.encode()
+        self.proc.stdin.write(b"%d\n" % len(payload) + payload)
+        self.proc.stdin.flush()
+        self.uses += 1
+
+        result = {}
+
+        def _read():
+            lines = []
+            started = False
+            while True:
+                line = self.proc.stdout.readline()
+                if not line:
+                    # Worker died mid-execution
+                    result["output"] = b"".join(lines).decode(errors="replace")
+                    result["status"] = 1
+                    return
+                if not started:
+                    if line.strip() == _EXEC_START:
+                        started = True
+                    continue
+                if line.startswith(_EXEC_EXIT_PREFIX):
+                    result["output"] = b"".join(lines).decode(errors="replace")
+                    try:
+                        result["status"] = int(line.strip()[len(_EXEC_EXIT_PREFIX):].rstrip(b">"))
+                    except ValueError:
+                        # Garbled sentinel (e.g. interleaved writes); call it a failure
+                        result["status"] = 1
+                    return
+                lines.append(line)
+
+        reader = threading.Thread(target=_read, daemon=True)
+        reader.start()
+        reader.join(timeout)
+        if "status" not in result:
+            self.kill()
+            raise subprocess.TimeoutExpired(self.language, timeout)
+
+        return result["output"], result["status"]
+
+class InterpreterPool:
+    """Checkout/checkin pool of persistent workers for one language"""
+
+    def __init__(self, language, max_size=4, max_uses=100):
+        self.language = language
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def _checkout(self):
+        with self._lock:
+            while self._idle:
+                worker = self._idle.popleft()
+                if worker.alive():
+                    return worker
+                worker.kill()
+        return InterpreterWorker(self.language)
+
+    def _checkin(self, worker):
+        with self._lock:
+            if worker.alive() and worker.uses < self.max_uses and len(self._idle) < self.max_size:
+                self._idle.append(worker)
+                return
+        worker.kill()
+
+    def execute(self, code, timeout=EXEC_TIMEOUT):
+        worker = self._checkout()
+        try:
+            output, status = worker.execute(code, timeout=timeout)
+        except Exception:
+            worker.kill()
+            raise
+        self._checkin(worker)
+        return output, status
+
+    def shutdown(self):
+        with self._lock:
+            while self._idle:
+                self._idle.popleft().kill()
+
+_INTERPRETER_POOLS = {
+    "Python": InterpreterPool("Python"),
+    "JavaScript": InterpreterPool("JavaScript")
+}
+
+def _shutdown_pools():
+    for pool in _INTERPRETER_POOLS.values():
+        pool.shutdown()
+
+atexit.register(_shutdown_pools)
+
+def _run_once(code, language):
+    """One-shot stdin-piped execution; fallback when the worker pool misbehaves"""
+    if language == "Python":
+        cmd = [sys.executable, "-I", "-"]
+    else:
+        cmd = ["node", f"--max-old-space-size={EXEC_NODE_HEAP_MB}", "-"]
+    result = subprocess.run(
+        cmd,
+        input=code,
+        capture_output=True,
+        text=True,
+        timeout=EXEC_TIMEOUT,
+        close_fds=True,
+        start_new_session=True,
+        preexec_fn=_sandbox_limits(EXEC_CPU_SECONDS, language)
+    )
+    output = result.stdout if result.returncode == 0 else (result.stderr or result.stdout)
+    return output, result.returncode
+
+def run_code(code, language):
+    """Execute code and return output"""
+    try:
+        if not code.strip():
+            return "⚠️ No code to run!", ""
+
+        pool = _INTERPRETER_POOLS.get(language)
+        if pool is None:
+            return f"⚠️ Code execution for {language} is not supported yet. Only Python and JavaScript are supported.", ""
+
+        try:
+            output, status = pool.execute(code, timeout=EXEC_TIMEOUT)
+        except FileNotFoundError:
+            return "❌ Node.js not installed! Only Python execution is available.", ""
+        except (OSError, ValueError):
+            output, status = _run_once(code, language)
+
+        if status == 0:
+            return f"✅ Execution Successful\n\n{output}", output
+        else:
+            return f"❌ Execution Failed\n\n{output}", output
+
+    except subprocess.TimeoutExpired:
+        return "❌ Execution timeout! Code took too long to run.", ""
+    except Exception as e:
+        return f"❌ Execution error: {str(e)}", ""
+
+# In-flight coalescing: concurrent analyses of identical code await the first
+# request's future instead of each burning a Groq call
+_inflight = {}
+
+def _resolve_inflight(key, result):
+    """Hand the final result tuple to any coalesced waiters and clear the slot"""
+    fut = _inflight.pop(key, None)
+    if fut is not None and not fut.done():
+        fut.set_result(result)
+
+# Matches non-blank, non-fence lines; one C-level scan instead of split+strip per line
+_SUMMARY_RE = re.compile(r"^(?!```)(\S.*)$", re.MULTILINE)
+
+# Patterns applied to every analysis, compiled once at import so the hot parse
+# path skips re's per-call cache lookup (and its eviction risk)
+_CODE_RE = re.compile(r'```[\w]*\n(.*?)\n```', re.DOTALL)
+_TIME_RE = re.compile(r'TIME COMPLEXITY[:\s]+O\(([^)]+)\)', re.IGNORECASE)
+_SPACE_RE = re.compile(r'SPACE COMPLEXITY[:\s]+O\(([^)]+)\)', re.IGNORECASE)
+_NO_ERRORS_RE = re.compile(r'NO\s+ERRORS', re.IGNORECASE)
+_ERRORS_FOUND_RE = re.compile(r'ERRORS\s+FOUND', re.IGNORECASE)
+_ERROR_STATUS_RE = re.compile(r'ERROR\s+STATUS', re.IGNORECASE)
+
+def generate_summary(analysis, max_lines=5):
+    """First few meaningful lines of an analysis, found in a single regex scan"""
+    hits = itertools.islice(_SUMMARY_RE.finditer(analysis), max_lines)
+    return "\n".join(m.group(1) for m in hits)
+
+def parse_analysis(analysis):
+    """Extract error status, corrected code and complexities from an analysis"""
+    # Parse error status: the prompt puts the ERROR STATUS line first, so the
+    # verdict is decided from the head of the response rather than re-scanning
+    # the whole multi-KB text (where "no errors" can also appear in prose)
+    head = analysis[:200]
+    if _NO_ERRORS_RE.search(head) and not _ERRORS_FOUND_RE.search(head):
+        error_status = "✅ NO ERRORS DETECTED"
+    elif not _ERROR_STATUS_RE.search(head):
+        # Free-form response: surface its opening line instead of guessing a verdict
+        first_line = generate_summary(analysis, max_lines=1)
+        error_status = first_line[:120] if first_line else "❌ ERRORS FOUND"
+    else:
+        error_status = "❌ ERRORS FOUND"
+
+    # Extract corrected code
+    corrected_code = ""
+    code_match = _CODE_RE.search(analysis)
+    if code_match:
+        corrected_code = code_match.group(1).strip()
+        if "no correction" in corrected_code.lower():
+            corrected_code = "No corrections needed - code is clean!"
+    else:
+        corrected_code = "No corrections needed"
+
+    # Extract complexities
+    time_complexity = "Not analyzed"
+    space_complexity = "Not analyzed"
+
+    time_match = _TIME_RE.search(analysis)
+    if time_match:
+        time_complexity = f"O({time_match.group(1).strip()})"
+
+    space_match = _SPACE_RE.search(analysis)
+    if space_match:
+        space_complexity = f"O({space_match.group(1).strip()})"
+
+    complexity_display = f"⏱️ Time: {time_complexity}  |  💾 Space: {space_complexity}"
+
+    return error_status, corrected_code, complexity_display
+
+async def analyze_code_short(code, language, api_key, user=None, client=None):
+    """Quick analysis with error detection and corrected code, streamed token by token"""
+    global _active_streams
+
+    if not user:
+        yield "⚠️ Please login first!", "⚠️ Login Required", "", "", "⚠️ Login Required"
+        return
+
+    inflight_key = None
+    try:
+        if client is None and api_key:
+            init_result, client = initialize_groq(api_key)
+            if client is None:
+                yield init_result, "⚠️ API Key Required", "", "", "⚠️ Configure API Key"
+                return
+
+        if client is None:
+            yield "⚠️ Please set your Groq API key first!", "⚠️ API Key Required", "", "", "⚠️ Configure API Key"
+            return
+
+        if not code.strip():
+            yield "⚠️ Please enter code to analyze!", "⚠️ No Code", "", "", "⚠️ Code Required"
+            return
+
+        cached = exact_cache_lookup(language, code)
+        if cached is None:
+            # Embedding the query is CPU-bound; keep it off the event loop
+            cached = await asyncio.to_thread(semantic_cache_lookup, language, code)
+        if cached:
+            error_status, corrected_code, complexity_display = parse_analysis(cached)
+            yield cached, error_status, corrected_code, complexity_display, "✅ Served from cache"
+            return
+
+        # Coalesce with an identical request already in flight
+        waiter = _inflight.get(_exact_cache_key(language, code))
+        if waiter is not None:
+            yield "⏳ An identical analysis is already running...", "⏳ Analyzing...", "", "", "⏳ Coalesced with in-flight request"
+            try:
+                yield await waiter
+                return
+            except asyncio.CancelledError:
+                if not waiter.cancelled():
+                    raise
+                # The originating request was cancelled (e.g. its client
+                # disconnected) before producing a result; run our own
+
+        inflight_key = _exact_cache_key(language, code)
+        _inflight[inflight_key] = asyncio.get_running_loop().create_future()
+
+        system_prompt = SYSTEM_PROMPT
+
+        # Large Python files: analyze top-level chunks concurrently, then merge
+        chunks = split_python_code(code) if language == "Python" and len(code) > LARGE_CODE_THRESHOLD else []
+        if len(chunks) > 1:
+            yield f"⏳ Large input: analyzing {len(chunks)} sections in parallel...", "⏳ Analyzing...", "", "", "⏳ Chunked analysis..."
+
+            partials = await asyncio.gather(*[
+                _groq_chat(
+                    client,
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": USER_PROMPT_TEMPLATE.format_map({
+                            "language": language,
+                            "language_tag": language.lower(),
+                            "code": chunk
+                        })}
+                    ],
+                    max_tokens=512
+                )
+                for chunk in chunks
+            ])
+
+            merge_prompt = (
+                f"These are analyses of separate sections of one {language} file. "
+                "Merge them into a single analysis in the same format:\n\n"
+                + "\n---\n".join(partials)
+            )
+            analysis = await _groq_chat(
+                client,
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": merge_prompt}
+                ],
+                max_tokens=MAX_TOKENS_DEFAULT
+            )
+
+            error_status, corrected_code, complexity_display = parse_analysis(analysis)
+            exact_cache_store(language, code, analysis)
+            await asyncio.to_thread(semantic_cache_store, language, code, analysis)
+
+            record_analysis(user)
+
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            final = (analysis, error_status, corrected_code, complexity_display, f"✅ Completed at {timestamp}")
+            _resolve_inflight(inflight_key, final)
+            yield final
+            return
+
+        if _active_streams > 0:
+            # Another analysis is already streaming: join the batch drainer
+            # instead of spending a separate rate-limit unit
+            yield "⏳ Batching with concurrent requests...", "⏳ Analyzing...", "", "", "⏳ Queued for batched analysis"
+            analysis = await _analyze_via_batcher(client, language, code)
+        else:
+            user_prompt = USER_PROMPT_TEMPLATE.format_map({
+                "language": language,
+                "language_tag": language.lower(),
+                "code": code
+            })
+
+            _active_streams += 1
+            try:
+                stream = await _groq_create(
+                    client,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    model=GROQ_MODEL,
+                    temperature=0.2,
+                    max_tokens=max_tokens_for(code),
+                    stream=True,
+                )
+
+                # Accumulate deltas in a list and join at flush time: per-token
+                # += on a growing string is quadratic in response length
+                parts = []
+                total_len = 0
+                last_len = 0
+                last_flush = time.monotonic()
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content or ""
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    total_len += len(delta)
+
+                    now = time.monotonic()
+                    if total_len - last_len >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                        last_len = total_len
+                        last_flush = now
+                        yield "".join(parts), "⏳ Analyzing...", "", "", "⏳ Streaming response..."
+            finally:
+                _active_streams -= 1
+
+            analysis = "".join(parts)
+
+        error_status, corrected_code, complexity_display = parse_analysis(analysis)
+        exact_cache_store(language, code, analysis)
+        await asyncio.to_thread(semantic_cache_store, language, code, analysis)
+
+        # Update user stats
+        record_analysis(user)
+        
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        status_display = f"✅ Completed at {timestamp}"
+
+        final = (analysis, error_status, corrected_code, complexity_display, status_display)
+        _resolve_inflight(inflight_key, final)
+        yield final
+
+    except Exception as e:
+        if _is_rate_limit_error(e):
+            msg = "⏳ The API is throttling requests right now. Please retry in a few seconds."
+            final = (msg, "⏳ THROTTLED", "", "", "⏳ Rate limited - retry shortly")
+        else:
+            final = (f"❌ Error: {str(e)}", "❌ ANALYSIS FAILED", "", "", f"❌ Failed: {str(e)}")
+        if inflight_key is not None:
+            _resolve_inflight(inflight_key, final)
+        yield final
+
+    finally:
+        # A client disconnect or cancel unwinds this generator with
+        # CancelledError/GeneratorExit, which the except above never sees.
+        # Cancel the orphaned future so coalesced waiters stop blocking on it
+        # and fall through to a fresh request
+        if inflight_key is not None:
+            orphan = _inflight.pop(inflight_key, None)
+            if orphan is not None and not orphan.done():
+                orphan.cancel()
+
+async def run_code_async(code, language):
+    """Async wrapper so blocking pool execution runs off the event loop"""
+    return await asyncio.to_thread(run_code, code, language)
+
+async def run_and_analyze(code, language, api_key, user=None, client=None):
+    """Run code and analyze it concurrently"""
+    run_task = asyncio.create_task(run_code_async(code, language))
+
+    result = ("", "⚪ Waiting...", "", "", "⏳ Analyzing...")
+    run_display = "⏳ Running code..."
+    async for result in analyze_code_short(code, language, api_key, user, client):
+        if run_task.done():
+            run_display = run_task.result()[0]
+        yield result + (run_display,)
+
+    run_output, _ = await run_task
+    yield result + (run_output,)
+
+# Static styling is served from assets/ as a cacheable file instead of being
+# inlined into every page; fonts load through non-blocking <link> tags with
+# preconnect rather than a render-blocking CSS @import
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+# The /file= route resolves against the server's cwd, so the stylesheet URL is
+# built from the same absolute path handed to allowed_paths — the app then
+# styles correctly no matter which directory it is launched from
+HEAD_HTML = f"""
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap">
+<link rel="stylesheet" href="/file={os.path.join(ASSETS_DIR, 'coderefine.css')}">
+"""
+
+# The UI is built by a factory so process managers can construct the app at
+# import time: each gunicorn/uvicorn worker imports this module, builds its own
+# Blocks instance and pulls from its own queue.
+def build_app():
+    """Construct the Gradio Blocks app"""
+    with gr.Blocks(title="CodeRefine - Professional Code Analysis", head=HEAD_HTML) as app:
+
+        # Per-session state: each browser session gets its own logged-in user and
+        # Groq client, so concurrent users don't overwrite each other
+        user_state = gr.State(None)
+        client_state = gr.State(None)
+
+        # Authentication Pages
+        with gr.Column(visible=True) as auth_page:
+            gr.HTML("""
+            <div class="main-header">
+                <h1>🚀 CodeRefine</h1>
+                <h3>Professional AI Code Analysis & Execution Platform</h3>
+                <p>Instant Error Detection • Auto-Correction • Complexity Analysis • Code Execution</p>
+            </div>
+            """)
+        
+            with gr.Row():
+                with gr.Column(scale=1):
+                    gr.Markdown("")
+                with gr.Column(scale=2):
+                    with gr.Tabs():
+                        with gr.Tab("🔐 Login"):
+                            gr.Markdown("### Welcome Back!")
+                            login_username = gr.Textbox(label="Username", placeholder="Enter your username")
+                            login_password = gr.Textbox(label="Password", type="password", placeholder="Enter your password")
+                            login_btn = gr.Button("🚀 Login", variant="primary", size="lg")
+                            login_status = gr.Textbox(label="Status", interactive=False)
+                    
+                        with gr.Tab("📝 Sign Up"):
+                            gr.Markdown("### Create Your Account")
+                            signup_username = gr.Textbox(label="Username", placeholder="Choose a unique username")
+                            signup_password = gr.Textbox(label="Password", type="password", placeholder="Min 6 characters")
+                            signup_confirm = gr.Textbox(label="Confirm Password", type="password", placeholder="Re-enter password")
+                            signup_btn = gr.Button("✨ Create Account", variant="primary", size="lg")
+                            signup_status = gr.Textbox(label="Status", interactive=False)
+                with gr.Column(scale=1):
+                    gr.Markdown("")
+    
+        # Main Application
+        with gr.Column(visible=False) as main_page:
+            gr.HTML("""
+            <div class="main-header">
+                <h1>🚀 CodeRefine</h1>
+                <h3>Professional Code Analysis Platform</h3>
+                <p>AI-Powered Error Detection • Auto-Correction • Complexity Analysis • Live Execution</p>
+            </div>
+            """)
+        
+            with gr.Row():
+                with gr.Column(scale=4):
+                    gr.Markdown("### 👤 Session Active")
+                with gr.Column(scale=1):
+                    logout_btn = gr.Button("🚪 Logout", size="sm", variant="secondary")
+        
+            gr.Markdown("---")
+        
+            # API Key Section
+            with gr.Row():
+                with gr.Column(scale=3):
+                    api_key_input = gr.Textbox(
+                        label="🔑 Groq API Key",
+                        placeholder="Get your free API key from console.groq.com",
+                        type="password"
+                    )
+                with gr.Column(scale=2):
+                    api_status = gr.Textbox(label="🔌 Connection Status", value="⚪ Not Connected", interactive=False)
+                with gr.Column(scale=1):
+                    set_api_btn = gr.Button("Connect", variant="primary", size="lg")
+        
+            set_api_btn.click(
+                fn=initialize_groq,
+                inputs=[api_key_input],
+                outputs=[api_status, client_state]
+            )
+        
+            gr.Markdown("---")
+        
+            # Main Interface
+            with gr.Row():
+                # Left: Code Input
+                with gr.Column(scale=3):
+                    gr.Markdown("### 📝 Code Editor")
+                    code_input = gr.Code(
+                        label="",
+                        language="python",
+                        lines=22
+                    )
+                
+                    language_select = gr.Dropdown(
+                        choices=LANGUAGES,
+                        value="Python",
+                        label="Programming Language"
+                    )
+                
+                    with gr.Row():
+                        analyze_btn = gr.Button("🔍 Analyze", variant="primary", size="lg", scale=1)
+                        run_btn = gr.Button("▶️ Run", variant="secondary", size="lg", scale=1)
+                        both_btn = gr.Button("🚀 Analyze & Run", variant="primary", size="lg", scale=2)
+                        clear_cache_btn = gr.Button("🧹 Clear Cache", variant="secondary", size="sm", scale=1)
+            
+                # Right: Quick Results
+                with gr.Column(scale=2):
+                    gr.Markdown("### 📊 Quick Results")
+                
+                    error_status_output = gr.Textbox(
+                        label="",
+                        value="⚪ Waiting for analysis...",
+                        interactive=False,
+                        lines=2,
+                        elem_classes="results-card"
+                    )
+                
+                    complexity_output = gr.Textbox(
+                        label="",
+                        value="⏱️ Time: - | 💾 Space: -",
+                        interactive=False,
+                        lines=2,
+                        elem_classes="results-card"
+                    )
+                
+                    status_output = gr.Textbox(
+                        label="",
+                        value="⏳ Ready to analyze",
+                        interactive=False,
+                        lines=2,
+                        elem_classes="results-card"
+                    )
+        
+            gr.Markdown("---")
+        
+            # Results Tabs
+            with gr.Tabs():
+                with gr.Tab("📊 Full Analysis"):
+                    analysis_output = gr.Markdown(value="*Analysis results will appear here...*")
+            
+                with gr.Tab("✅ Corrected Code"):
+                    corrected_output = gr.Code(
+                        label="",
+                        language="python",
+                        lines=15,
+                        value="# Corrected code will appear here after analysis"
+                    )
+            
+                with gr.Tab("▶️ Execution Output"):
+                    run_output = gr.Textbox(
+                        label="",
+                        lines=15,
+                        interactive=False,
+                        value="Code execution output will appear here..."
+                    )
+        
+            gr.Markdown("---")
+        
+            # Examples
+            gr.Markdown("### 📚 Try These Examples (with intentional errors)")
+            gr.Examples(
+                examples=[
+                    ["""def factorial(n):
+    if n = 1:  # Error: = should be ==
+        return 1
+    return n * factorial(n-1)
+
+print(factorial(5))""", "Python"],
+                    ["""def bubble_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n-i-1):
+            if arr[j] > arr[j+1]:
+                arr[j], arr[j+1] = arr[j+1], arr[j]
+    return arr
+
+print(bubble_sort([64, 34, 25, 12, 22]))""", "Python"],
+                    ["""function sum(a, b) {
+    return a + b
+}
+console.log(sum(10, 20))""", "JavaScript"],
+                ],
+                inputs=[code_input, language_select]
+            )
+        
+            # Event handlers
+            analyze_btn.click(
+                fn=analyze_code_short,
+                inputs=[code_input, language_select, api_key_input, user_state, client_state],
+                outputs=[analysis_output, error_status_output, corrected_output, complexity_output, status_output]
+            )
+        
+            run_btn.click(
+                fn=run_code_async,
+                inputs=[code_input, language_select],
+                outputs=[run_output, gr.Textbox(visible=False)]
+            )
+        
+            both_btn.click(
+                fn=run_and_analyze,
+                inputs=[code_input, language_select, api_key_input, user_state, client_state],
+                outputs=[analysis_output, error_status_output, corrected_output, complexity_output, status_output, run_output]
+            )
+
+            clear_cache_btn.click(
+                fn=clear_analysis_cache,
+                outputs=[status_output]
+            )
+        
+            # Footer
+            gr.HTML("""
+            <div class="footer">
+                <p style="font-size: 1.1em; font-weight: 600; margin-bottom: 10px;">
+                    Built with ❤️ using Gradio & Groq
+                </p>
+                <p style="margin: 5px 0;">CodeRefine v3.0 Professional Edition</p>
+                <p style="color: #999;">Powered by Llama 3.3 70B Versatile</p>
+            </div>
+            """)
+    
+        # Authentication handlers
+        login_btn.click(
+            fn=login,
+            inputs=[login_username, login_password],
+            outputs=[login_status, main_page, auth_page, user_state]
+        )
+    
+        signup_btn.click(
+            fn=signup,
+            inputs=[signup_username, signup_password, signup_confirm],
+            outputs=[signup_status, main_page]
+        )
+    
+        logout_btn.click(
+            fn=logout,
+            outputs=[main_page, auth_page, user_state, client_state]
+        )
+
+    return app
+
+# Module-scope instance so deployment tooling can import codeeee:app, e.g. to
+# mount it on a FastAPI host with gr.mount_gradio_app (Blocks.app only exists
+# after launch()/mounting, so it can't be pointed at directly from gunicorn).
+# Note Gradio's queue and session state are per-process: scaling out means
+# sticky routing across whole app processes, not workers sharing one queue.
+app = build_app()
+app.queue(default_concurrency_limit=10, max_size=200, status_update_rate=2)
+# Launch
+if __name__ == "__main__":
+    print("=" * 80)
+    print("🚀 CodeRefine v3.0 - Professional Code Analysis Platform")
+    print("=" * 80)
+    print("✨ Features:")
+    print("   ✅ User Authentication (Signup/Login)")
+    print("   ✅ Error Detection with Auto-Correction")
+    print("   ✅ Time & Space Complexity Analysis")
+    print("   ✅ Live Code Execution (Python & JavaScript)")
+    print("   ✅ Professional UI with Modern Design")
+    print("   ✅ Quick Results Display (UPDATED)")
+    print("=" * 80)
+    print("📍 Server: http://127.0.0.1:7860")
+    print("🔑 Get Free API Key: https://console.groq.com")
+    print("=" * 80)
+
+    app.launch(
+        share=False,
+        server_name="127.0.0.1",
+        server_port=7860,
+        show_error=True,
+        allowed_paths=[ASSETS_DIR]
     )
\ No newline at end of file